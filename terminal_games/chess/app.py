@@ -1,17 +1,48 @@
 from dataclasses import replace
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 import chess
 from textual.app import App, ComposeResult
 from textual import events
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static
 from .models import GameState, Difficulty, create_initial_state, push_move, PIECE_SYMBOLS
-from .chess_ai import get_best_move, get_captured_pieces
+from .chess_ai import get_best_move
 from .widgets.chess_board import ChessBoard
 from ..config import get_theme, set_theme
+def _build_opening_book(lines: dict[str, str]) -> dict[str, chess.Move]:
+    book: dict[str, chess.Move] = {}
+    for line, reply in lines.items():
+        board = chess.Board()
+        for uci in line.split():
+            board.push_uci(uci)
+        book[board.fen()] = chess.Move.from_uci(reply)
+    return book
+# Replies for the first few plies, keyed by the moves played so far
+OPENING_BOOK = _build_opening_book({
+    "": "e2e4",
+    "e2e4": "e7e5",
+    "d2d4": "d7d5",
+    "c2c4": "e7e5",
+    "g1f3": "d7d5",
+    "e2e4 e7e5": "g1f3",
+    "e2e4 c7c5": "g1f3",
+    "e2e4 e7e6": "d2d4",
+    "e2e4 c7c6": "d2d4",
+    "d2d4 d7d5": "c2c4",
+    "d2d4 g8f6": "c2c4",
+    "e2e4 e7e5 g1f3": "b8c6",
+    "e2e4 e7e5 f1c4": "g8f6",
+    "e2e4 e7e5 b1c3": "g8f6",
+    "d2d4 d7d5 c2c4": "e7e6",
+    "d2d4 d7d5 g1f3": "g8f6",
+})
+# Searches this shallow finish faster than a worker-thread handoff
+INLINE_SEARCH_DEPTH = Difficulty.EASY.value
 class ChessApp(App):
     CSS_PATH = Path(__file__).parent / "styles" / "chess.tcss"
     ENABLE_COMMAND_PALETTE = False
@@ -37,6 +68,7 @@ class ChessApp(App):
         self._board: Optional[ChessBoard] = None
         self._sidebar: Optional[Static] = None
         self._executor = ThreadPoolExecutor(max_workers=1)
+        self._resize_timer: Optional[Timer] = None
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Horizontal(
@@ -61,7 +93,10 @@ class ChessApp(App):
             self._trigger_ai_move()
 
     def on_resize(self, event: events.Resize) -> None:
-        self._configure_layout()
+        # Coalesce bursts of resize events into a single layout pass
+        if self._resize_timer:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(0.05, self._configure_layout)
 
     def _calculate_cell_size(self) -> tuple[int, int]:
         screen_width = self.size.width
@@ -118,7 +153,7 @@ class ChessApp(App):
             elif "Check" in status:
                 lines.append(f"[bold red]{status}[/bold red]")
         lines.append("")
-        captured = get_captured_pieces(self.state.board)
+        captured = self.state.captured
         lines.append("[bold]Captured:[/bold]")
         if captured[chess.WHITE]:
             pieces_str = "".join(
@@ -142,11 +177,28 @@ class ChessApp(App):
             return
         self.state = replace(self.state, is_thinking=True)
         self._update_widgets()
+        # The board the move is for; push_move and resets replace it, so a
+        # move that lands after either is stale and dropped
+        board = self.state.board
+        book_move = OPENING_BOOK.get(board.fen())
+        if book_move is not None:
+            self.call_after_refresh(self._apply_ai_move, book_move, board)
+            return
         depth = self.state.config.difficulty.value
-        future = self._executor.submit(get_best_move, self.state.board.copy(), depth)
-        future.add_done_callback(self._on_ai_move_complete)
-    def _on_ai_move_complete(self, future) -> None:
-        move = future.result()
+        if depth <= INLINE_SEARCH_DEPTH:
+            self.call_after_refresh(self._run_search_inline, depth, board)
+            return
+        future = self._executor.submit(get_best_move, board.copy(), depth)
+        future.add_done_callback(partial(self._on_ai_move_complete, board))
+    def _run_search_inline(self, depth: int, board: chess.Board) -> None:
+        if board is not self.state.board:
+            return
+        self._apply_ai_move(get_best_move(board, depth), board)
+    def _on_ai_move_complete(self, board: chess.Board, future) -> None:
+        self.call_from_thread(self._apply_ai_move, future.result(), board)
+    def _apply_ai_move(self, move: Optional[chess.Move], board: chess.Board) -> None:
+        if board is not self.state.board:
+            return
         if move:
             self.state = push_move(
                 replace(self.state, is_thinking=False),
@@ -154,7 +206,7 @@ class ChessApp(App):
             )
         else:
             self.state = replace(self.state, is_thinking=False)
-        self.call_from_thread(self._update_widgets)
+        self._update_widgets()
     def action_move_up(self) -> None:
         if self.state.is_thinking or self.state.is_game_over():
             return
@@ -228,31 +280,20 @@ class ChessApp(App):
         if self.state.selected_square is None:
             piece = self.state.board.piece_at(cursor)
             if piece and piece.color == self.state.config.player_color:
-                has_moves = any(
-                    m.from_square == cursor for m in self.state.board.legal_moves
-                )
-                if has_moves:
+                if self.state.has_legal_moves_from(cursor):
                     self.state = replace(self.state, selected_square=cursor)
         else:
             legal_moves = self.state.get_legal_moves_from_selected()
             if cursor in legal_moves:
-                from_sq = self.state.selected_square
-                to_sq = cursor
-                move = None
-                for m in self.state.board.legal_moves:
-                    if m.from_square == from_sq and m.to_square == to_sq:
-                        if m.promotion:
-                            if m.promotion == chess.QUEEN:
-                                move = m
-                                break
-                        else:
-                            move = m
-                            break
-                if move is None:
-                    for m in self.state.board.legal_moves:
-                        if m.from_square == from_sq and m.to_square == to_sq:
-                            move = m
-                            break
+                candidates = list(self.state.board.generate_legal_moves(
+                    from_mask=chess.BB_SQUARES[self.state.selected_square],
+                    to_mask=chess.BB_SQUARES[cursor],
+                ))
+                # Auto-promote to a queen when the move is a promotion
+                move = next(
+                    (m for m in candidates if m.promotion in (None, chess.QUEEN)),
+                    candidates[0] if candidates else None,
+                )
                 if move:
                     self.state = push_move(self.state, move)
                     self._update_widgets()
@@ -262,10 +303,7 @@ class ChessApp(App):
             else:
                 piece = self.state.board.piece_at(cursor)
                 if piece and piece.color == self.state.config.player_color:
-                    has_moves = any(
-                        m.from_square == cursor for m in self.state.board.legal_moves
-                    )
-                    if has_moves:
+                    if self.state.has_legal_moves_from(cursor):
                         self.state = replace(self.state, selected_square=cursor)
                     else:
                         self.state = replace(self.state, selected_square=None)
@@ -1,6 +1,8 @@
 import random
+from collections import OrderedDict
 from typing import Optional
 import chess
+import chess.polyglot
 PIECE_VALUES = {
     chess.PAWN: 100,
     chess.KNIGHT: 320,
@@ -77,124 +79,164 @@ PIECE_TABLES = {
     chess.QUEEN: QUEEN_TABLE,
     chess.KING: KING_MIDDLEGAME_TABLE,
 }
-def get_piece_square_value(piece_type: int, square: int, is_white: bool) -> int:
-    table = PIECE_TABLES.get(piece_type)
-    if table is None:
-        return 0
-    if is_white:
-        index = (7 - chess.square_rank(square)) * 8 + chess.square_file(square)
-    else:
-        index = square
-    return table[index]
 def evaluate_board(board: chess.Board) -> int:
     if board.is_checkmate():
         return -20000 if board.turn == chess.WHITE else 20000
     if board.is_stalemate() or board.is_insufficient_material():
         return 0
     score = 0
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece is None:
-            continue
-        value = PIECE_VALUES[piece.piece_type]
-        positional = get_piece_square_value(
-            piece.piece_type, square, piece.color == chess.WHITE
+    # Walk the per-piece bitboards so only occupied squares are visited
+    for piece_type, table in PIECE_TABLES.items():
+        white_bb = board.pieces_mask(piece_type, chess.WHITE)
+        black_bb = board.pieces_mask(piece_type, chess.BLACK)
+        score += PIECE_VALUES[piece_type] * (
+            chess.popcount(white_bb) - chess.popcount(black_bb)
         )
-        total = value + positional
-        if piece.color == chess.WHITE:
-            score += total
-        else:
-            score -= total
+        for square in chess.scan_forward(white_bb):
+            # White tables are laid out from rank 8 down; flip the rank
+            score += table[square ^ 56]
+        for square in chess.scan_forward(black_bb):
+            score -= table[square]
     mobility = len(list(board.legal_moves))
     if board.turn == chess.WHITE:
         score += mobility * 2
     else:
         score -= mobility * 2
     return score
+EVAL_CACHE_SIZE = 65536
+# Leaf scores keyed by Zobrist hash; transpositions are common within a search
+_eval_cache: OrderedDict[int, int] = OrderedDict()
+def evaluate_board_cached(board: chess.Board) -> int:
+    key = chess.polyglot.zobrist_hash(board)
+    score = _eval_cache.get(key)
+    if score is not None:
+        _eval_cache.move_to_end(key)
+        return score
+    score = evaluate_board(board)
+    _eval_cache[key] = score
+    if len(_eval_cache) > EVAL_CACHE_SIZE:
+        _eval_cache.popitem(last=False)
+    return score
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+# Transposition table entry: (depth, flag, value, best_move)
+TTEntry = tuple[int, int, int, Optional[chess.Move]]
+def order_moves(
+    board: chess.Board,
+    tt_move: Optional[chess.Move] = None,
+) -> list[chess.Move]:
+    def score(move: chess.Move) -> int:
+        if move == tt_move:
+            return 100
+        if board.is_capture(move):
+            # MVV-LVA: most valuable victim first, cheapest attacker breaks ties
+            if board.is_en_passant(move):
+                victim = chess.PAWN
+            else:
+                victim = board.piece_type_at(move.to_square)
+            return 10 * victim - board.piece_type_at(move.from_square)
+        return 0
+    return sorted(board.legal_moves, key=score, reverse=True)
 def minimax(
     board: chess.Board,
     depth: int,
     alpha: int,
     beta: int,
-    maximizing: bool
+    maximizing: bool,
+    tt: Optional[dict[int, TTEntry]] = None,
 ) -> int:
     if depth == 0 or board.is_game_over():
-        return evaluate_board(board)
+        return evaluate_board_cached(board)
+    key = 0
+    tt_move = None
+    if tt is not None:
+        key = chess.polyglot.zobrist_hash(board)
+        entry = tt.get(key)
+        if entry is not None:
+            entry_depth, flag, value, tt_move = entry
+            if entry_depth >= depth:
+                if flag == TT_EXACT:
+                    return value
+                if flag == TT_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    return value
+    original_alpha, original_beta = alpha, beta
+    best_move = None
     if maximizing:
-        max_eval = float('-inf')
-        for move in board.legal_moves:
+        best_eval = float('-inf')
+        for move in order_moves(board, tt_move):
             board.push(move)
-            eval_score = minimax(board, depth - 1, alpha, beta, False)
+            eval_score = minimax(board, depth - 1, alpha, beta, False, tt)
             board.pop()
-            max_eval = max(max_eval, eval_score)
+            if eval_score > best_eval:
+                best_eval = eval_score
+                best_move = move
             alpha = max(alpha, eval_score)
             if beta <= alpha:
                 break  
-        return max_eval
     else:
-        min_eval = float('inf')
-        for move in board.legal_moves:
+        best_eval = float('inf')
+        for move in order_moves(board, tt_move):
             board.push(move)
-            eval_score = minimax(board, depth - 1, alpha, beta, True)
+            eval_score = minimax(board, depth - 1, alpha, beta, True, tt)
             board.pop()
-            min_eval = min(min_eval, eval_score)
+            if eval_score < best_eval:
+                best_eval = eval_score
+                best_move = move
             beta = min(beta, eval_score)
             if beta <= alpha:
                 break  
-        return min_eval
+    if tt is not None:
+        if best_eval <= original_alpha:
+            flag = TT_UPPER
+        elif best_eval >= original_beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        tt[key] = (depth, flag, best_eval, best_move)
+    return best_eval
 def get_best_move(board: chess.Board, depth: int = 3) -> Optional[chess.Move]:
     if board.is_game_over():
         return None
-    best_moves: list[chess.Move] = []
     is_white = board.turn == chess.WHITE
-    best_value = float('-inf') if is_white else float('inf')
-    for move in board.legal_moves:
-        board.push(move)
-        value = minimax(
-            board, depth - 1, float('-inf'), float('inf'), not is_white
-        )
-        board.pop()
-        if is_white:
-            if value > best_value:
-                best_value = value
-                best_moves = [move]
-            elif value == best_value:
-                best_moves.append(move)
-        else:
-            if value < best_value:
-                best_value = value
-                best_moves = [move]
-            elif value == best_value:
-                best_moves.append(move)
+    tt: dict[int, TTEntry] = {}
+    best_moves: list[chess.Move] = []
+    # Iterative deepening: each pass seeds the table and root ordering for the next
+    for current_depth in range(1, depth + 1):
+        root_moves = best_moves + [
+            move for move in order_moves(board) if move not in best_moves
+        ]
+        best_moves = []
+        best_value = float('-inf') if is_white else float('inf')
+        for move in root_moves:
+            board.push(move)
+            # Scores are integers, so a window one point wider than the
+            # current best still returns exact values for tied moves
+            if is_white:
+                value = minimax(
+                    board, current_depth - 1, best_value - 1, float('inf'), False, tt
+                )
+            else:
+                value = minimax(
+                    board, current_depth - 1, float('-inf'), best_value + 1, True, tt
+                )
+            board.pop()
+            if is_white:
+                if value > best_value:
+                    best_value = value
+                    best_moves = [move]
+                elif value == best_value:
+                    best_moves.append(move)
+            else:
+                if value < best_value:
+                    best_value = value
+                    best_moves = [move]
+                elif value == best_value:
+                    best_moves.append(move)
     if not best_moves:
         return None
     return random.choice(best_moves)
-def get_captured_pieces(board: chess.Board) -> dict[chess.Color, list[chess.PieceType]]:
-    starting_counts = {
-        chess.PAWN: 8,
-        chess.KNIGHT: 2,
-        chess.BISHOP: 2,
-        chess.ROOK: 2,
-        chess.QUEEN: 1,
-        chess.KING: 1,
-    }
-    current_counts: dict[chess.Color, dict[chess.PieceType, int]] = {
-        chess.WHITE: {pt: 0 for pt in starting_counts},
-        chess.BLACK: {pt: 0 for pt in starting_counts},
-    }
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            current_counts[piece.color][piece.piece_type] += 1
-    captured: dict[chess.Color, list[chess.PieceType]] = {
-        chess.WHITE: [],
-        chess.BLACK: [],
-    }
-    for color in [chess.WHITE, chess.BLACK]:
-        for piece_type, starting in starting_counts.items():
-            if piece_type == chess.KING:
-                continue  
-            current = current_counts[color][piece_type]
-            missing = starting - current
-            captured[color].extend([piece_type] * missing)
-    return captured
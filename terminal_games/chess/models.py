@@ -20,14 +20,15 @@ class GameState:
     is_thinking: bool = False              
     last_move_from: Optional[int] = None   
     last_move_to: Optional[int] = None     
+    captured: tuple[tuple[int, ...], tuple[int, ...]] = ((), ())
     def get_legal_moves_from_selected(self) -> list[int]:
         if self.selected_square is None:
             return []
-        moves = []
-        for move in self.board.legal_moves:
-            if move.from_square == self.selected_square:
-                moves.append(move.to_square)
-        return moves
+        from_mask = chess.BB_SQUARES[self.selected_square]
+        return [move.to_square for move in self.board.generate_legal_moves(from_mask=from_mask)]
+    def has_legal_moves_from(self, square: int) -> bool:
+        from_mask = chess.BB_SQUARES[square]
+        return any(True for _ in self.board.generate_legal_moves(from_mask=from_mask))
     def is_player_turn(self) -> bool:
         return self.board.turn == self.config.player_color
     def get_game_status(self) -> str:
@@ -59,6 +60,16 @@ def create_initial_state(
         config=config,
     )
 def push_move(state: GameState, move: chess.Move) -> GameState:
+    captured = state.captured
+    if state.board.is_capture(move):
+        # Indexed by color: captured[chess.WHITE] holds the pieces White lost
+        if state.board.is_en_passant(move):
+            piece_type = chess.PAWN
+        else:
+            piece_type = state.board.piece_type_at(move.to_square)
+        victim = not state.board.turn
+        lost = captured[victim] + (piece_type,)
+        captured = (captured[0], lost) if victim == chess.WHITE else (lost, captured[1])
     new_board = state.board.copy()
     new_board.push(move)
     return replace(
@@ -67,6 +78,7 @@ def push_move(state: GameState, move: chess.Move) -> GameState:
         last_move_from=move.from_square,
         last_move_to=move.to_square,
         selected_square=None,
+        captured=captured,
     )
 PIECE_SYMBOLS = {
     (chess.PAWN, chess.WHITE): "♙",
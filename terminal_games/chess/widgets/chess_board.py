@@ -1,11 +1,24 @@
 from typing import Optional
 import chess
+from chess import BLACK, KING, square_file, square_rank
 from rich.segment import Segment
 from rich.style import Style
 from textual.strip import Strip
 from textual.widget import Widget
 from ..models import get_piece_symbol, get_theme_colors
 
+# Squares for each displayed row/column, indexed by is_flipped
+ROW_SQUARES: dict[bool, tuple[tuple[int, ...], ...]] = {
+    flipped: tuple(
+        tuple(
+            chess.square(7 - file_idx if flipped else file_idx, row_idx if flipped else 7 - row_idx)
+            for file_idx in range(8)
+        )
+        for row_idx in range(8)
+    )
+    for flipped in (False, True)
+}
+
 
 class ChessBoard(Widget):
     CELL_WIDTH = 9
@@ -17,6 +30,7 @@ class ChessBoard(Widget):
     ) -> None:
         super().__init__(id=id)
         self._board: chess.Board = chess.Board()
+        self._pieces: dict[int, chess.Piece] = self._board.piece_map()
         self._cursor_square: int = chess.E2
         self._selected_square: Optional[int] = None
         self._legal_moves: list[int] = []
@@ -24,9 +38,12 @@ class ChessBoard(Widget):
         self._last_move_to: Optional[int] = None
         self._player_color: chess.Color = chess.WHITE
         self._is_flipped: bool = False
+        self._row_squares = ROW_SQUARES[False]
         self._colors: dict = {}
         # Cache for styles to reduce object creation
         self._style_cache: dict = {}
+        # File label rows only depend on cell width and orientation
+        self._label_row_cache: dict[tuple[int, bool], Strip] = {}
 
     def update_state(
         self,
@@ -39,6 +56,8 @@ class ChessBoard(Widget):
         player_color: chess.Color,
     ) -> None:
         self._board = board
+        # piece_map walks only occupied squares; cells then do a dict lookup
+        self._pieces = board.piece_map()
         self._cursor_square = cursor_square
         self._selected_square = selected_square
         self._legal_moves = legal_moves
@@ -46,6 +65,7 @@ class ChessBoard(Widget):
         self._last_move_to = last_move_to
         self._player_color = player_color
         self._is_flipped = player_color == chess.BLACK
+        self._row_squares = ROW_SQUARES[self._is_flipped]
         
         # Update caches
         self._refresh_colors()
@@ -87,13 +107,18 @@ class ChessBoard(Widget):
         label_style = self._style_cache["label"]
 
         if y == 0 or y == total_height - 1:
-            segments.append(Segment("  "))
-            for file_idx in range(8):
-                file = file_idx if not self._is_flipped else 7 - file_idx
-                file_label = chr(ord('a') + file)
-                label = file_label.center(self.CELL_WIDTH)
-                segments.append(Segment(label, label_style))
-            return Strip(segments)
+            key = (self.CELL_WIDTH, self._is_flipped)
+            label_row = self._label_row_cache.get(key)
+            if label_row is None:
+                segments.append(Segment("  "))
+                for file_idx in range(8):
+                    file = file_idx if not self._is_flipped else 7 - file_idx
+                    file_label = chr(ord('a') + file)
+                    label = file_label.center(self.CELL_WIDTH)
+                    segments.append(Segment(label, label_style))
+                label_row = Strip(segments)
+                self._label_row_cache[key] = label_row
+            return label_row
 
         if board_start_y <= y < board_end_y:
             board_y = y - board_start_y
@@ -113,9 +138,7 @@ class ChessBoard(Widget):
                 segments.append(Segment("  "))
 
             # Board cells
-            for file_idx in range(8):
-                file = file_idx if not self._is_flipped else 7 - file_idx
-                square = chess.square(file, rank)
+            for square in self._row_squares[row_idx]:
                 cell_segments = self._render_cell(square, cell_y)
                 segments.extend(cell_segments)
 
@@ -129,9 +152,9 @@ class ChessBoard(Widget):
         return Strip([])
 
     def _render_cell(self, square: int, cell_y: int) -> list[Segment]:
-        piece = self._board.piece_at(square)
-        file = chess.square_file(square)
-        rank = chess.square_rank(square)
+        piece = self._pieces.get(square)
+        file = square_file(square)
+        rank = square_rank(square)
         
         # Determine background style
         is_cursor = square == self._cursor_square
@@ -140,7 +163,7 @@ class ChessBoard(Widget):
         
         is_check = (
             piece is not None
-            and piece.piece_type == chess.KING
+            and piece.piece_type == KING
             and self._board.is_check()
             and piece.color == self._board.turn
         )
@@ -169,7 +192,7 @@ class ChessBoard(Widget):
         if cell_y == 2:
             if piece:
                 piece_char = get_piece_symbol(piece)
-                piece_color = self._colors["black_piece"] if piece.color == chess.BLACK else self._colors["white_piece"]
+                piece_color = self._colors["black_piece"] if piece.color == BLACK else self._colors["white_piece"]
                 # Merge piece style with background
                 style = Style(color=piece_color, bgcolor=bg_color, bold=True)
                 return [Segment(piece_char.center(self.CELL_WIDTH), style)]
@@ -1,6 +1,6 @@
 import sys
 from importlib import import_module
-from typing import Optional
+from typing import Callable, Optional
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -24,6 +24,9 @@ GAME_ICONS = {
     "spaceinvaders": "\u25b2",
 }
 
+# Resolved game entry points, reused when the menu relaunches a game
+_MAIN_CACHE: dict[str, Callable[[], None]] = {}
+
 class LauncherApp(App):
     ENABLE_COMMAND_PALETTE = False
     CSS = """
@@ -127,8 +130,12 @@ class LauncherApp(App):
 
 def launch_game(game_id: str) -> int:
     try:
-        module = import_module(f"terminal_games.{game_id}.app")
-        main_func = getattr(module, "main")
+        main_func = _MAIN_CACHE.get(game_id)
+        if main_func is None:
+            module_name = f"terminal_games.{game_id}.app"
+            module = import_module(module_name)
+            main_func = getattr(module, "main")
+            _MAIN_CACHE[game_id] = main_func
         main_func()
         return 0
     except (ImportError, AttributeError) as e:
@@ -1,4 +1,6 @@
+from collections import deque
 from pathlib import Path
+from time import perf_counter
 from textual.app import App, ComposeResult
 from textual import events
 from textual.binding import Binding
@@ -12,12 +14,15 @@ from .game_logic import (
     change_direction,
     toggle_pause,
     spawn_apple,
+    occupancy_bits,
 )
 from .widgets.game_board import GameBoard
 from .widgets.hud import HUD
 from ..config import get_theme, set_theme
 
 TICK_INTERVAL = 1 / 10
+# Ticks a slow frame may run before the backlog is dropped
+MAX_TICKS_PER_FRAME = 3
 
 
 class SnakeApp(App):
@@ -44,10 +49,15 @@ class SnakeApp(App):
         super().__init__()
         self.config: BoardConfig | None = None
         self.state: GameState | None = None
+        self._last_rendered_state: GameState | None = None
         self._game_timer: Timer | None = None
+        self._loop_started: bool = False
+        self._last_tick_time: float = 0.0
+        self._sim_time_debt: float = 0.0
         self._board: GameBoard | None = None
         self._hud: HUD | None = None
         self._last_size: tuple[int, int] | None = None
+        self._pending_resize: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -61,7 +71,14 @@ class SnakeApp(App):
         self.theme = get_theme()
 
     def on_resize(self, event: events.Resize) -> None:
-        self._configure_layout()
+        size = (event.size.width, event.size.height)
+        if size == self._last_size:
+            return
+        self._last_size = size
+        # Coalesce bursts of resize events into a single layout pass
+        if self._pending_resize:
+            self._pending_resize.stop()
+        self._pending_resize = self.set_timer(0.1, self._configure_layout)
 
     def _calculate_board_config(self) -> BoardConfig:
         screen_width = self.size.width
@@ -108,8 +125,7 @@ class SnakeApp(App):
             self._board.config = self.config
             self._board.refresh()
 
-        if self._game_timer:
-            self._game_timer.resume()
+        self._resume_game_loop()
 
         self._update_widgets()
 
@@ -118,6 +134,19 @@ class SnakeApp(App):
             return 0
         return int(round(value * (new_max - 1) / (old_max - 1)))
 
+    def _compute_shift(
+        self,
+        bounds: tuple[int, int, int, int],
+        old_config: BoardConfig,
+        new_config: BoardConfig,
+    ) -> tuple[int, int]:
+        min_x, max_x, min_y, max_y = bounds
+        desired_dx = (new_config.columns - old_config.columns) // 2
+        desired_dy = (new_config.rows - old_config.rows) // 2
+        dx = max(-min_x, min((new_config.columns - 1) - max_x, desired_dx))
+        dy = max(-min_y, min((new_config.rows - 1) - max_y, desired_dy))
+        return dx, dy
+
     def _map_state_to_new_config(
         self,
         state: GameState,
@@ -127,28 +156,29 @@ class SnakeApp(App):
         old_cols = old_config.columns
         old_rows = old_config.rows
 
-        snake_cells = list(state.snake.cells)
-        min_x = min(cell.x for cell in snake_cells)
-        max_x = max(cell.x for cell in snake_cells)
-        min_y = min(cell.y for cell in snake_cells)
-        max_y = max(cell.y for cell in snake_cells)
+        snake_cells = state.snake.cells
+        head = state.snake.head
+        min_x = max_x = head.x
+        min_y = max_y = head.y
+        for cell in snake_cells:
+            if cell.x < min_x:
+                min_x = cell.x
+            elif cell.x > max_x:
+                max_x = cell.x
+            if cell.y < min_y:
+                min_y = cell.y
+            elif cell.y > max_y:
+                max_y = cell.y
 
         snake_width = max_x - min_x + 1
         snake_height = max_y - min_y + 1
+        fits = snake_width <= new_config.columns and snake_height <= new_config.rows
 
         mapped_cells: list[Position] = []
-        if snake_width <= new_config.columns and snake_height <= new_config.rows:
-            desired_dx = (new_config.columns - old_cols) // 2
-            desired_dy = (new_config.rows - old_rows) // 2
-
-            dx_min = -min_x
-            dx_max = (new_config.columns - 1) - max_x
-            dy_min = -min_y
-            dy_max = (new_config.rows - 1) - max_y
-
-            dx = max(dx_min, min(dx_max, desired_dx))
-            dy = max(dy_min, min(dy_max, desired_dy))
-
+        if fits:
+            dx, dy = self._compute_shift(
+                (min_x, max_x, min_y, max_y), old_config, new_config
+            )
             mapped_cells = [
                 Position(cell.x + dx, cell.y + dy)
                 for cell in snake_cells
@@ -173,19 +203,13 @@ class SnakeApp(App):
         mapped_snake = Snake(
             head=mapped_head,
             velocity=state.snake.velocity,
-            cells=tuple(mapped_cells),
+            cells=deque(mapped_cells),
+            body_set=set(mapped_cells[1:]),
             max_cells=state.snake.max_cells,
+            occupied_bits=occupancy_bits(mapped_cells, new_config),
         )
 
-        if snake_width <= new_config.columns and snake_height <= new_config.rows:
-            desired_dx = (new_config.columns - old_cols) // 2
-            desired_dy = (new_config.rows - old_rows) // 2
-            dx_min = -min_x
-            dx_max = (new_config.columns - 1) - max_x
-            dy_min = -min_y
-            dy_max = (new_config.rows - 1) - max_y
-            dx = max(dx_min, min(dx_max, desired_dx))
-            dy = max(dy_min, min(dy_max, desired_dy))
+        if fits:
             apple_x = state.apple.x + dx
             apple_y = state.apple.y + dy
         else:
@@ -196,8 +220,8 @@ class SnakeApp(App):
             max(0, min(new_config.columns - 1, apple_x)),
             max(0, min(new_config.rows - 1, apple_y)),
         )
-        if mapped_apple in mapped_snake.cells:
-            mapped_apple = spawn_apple(mapped_snake.cells, new_config)
+        if mapped_apple == mapped_head or mapped_apple in mapped_snake.body_set:
+            mapped_apple = spawn_apple(mapped_snake.occupied_bits, new_config)
 
         return GameState(
             snake=mapped_snake,
@@ -209,22 +233,52 @@ class SnakeApp(App):
         )
 
     def _start_game_loop(self) -> None:
-        self._game_timer = self.set_interval(
-            TICK_INTERVAL,
+        self._loop_started = True
+        self._last_tick_time = perf_counter()
+        self._sim_time_debt = 0.0
+        self._game_timer = self.set_timer(TICK_INTERVAL, self._game_tick)
+
+    def _pause_game_loop(self) -> None:
+        if self._game_timer:
+            self._game_timer.stop()
+            self._game_timer = None
+
+    def _resume_game_loop(self) -> None:
+        if self._loop_started and self._game_timer is None:
+            self._start_game_loop()
+
+    def _game_tick(self) -> None:
+        # Run every tick owed since the last frame, then render once
+        now = perf_counter()
+        self._sim_time_debt += now - self._last_tick_time
+        self._last_tick_time = now
+
+        steps = 0
+        while self._sim_time_debt >= TICK_INTERVAL and steps < MAX_TICKS_PER_FRAME:
+            self._sim_time_debt -= TICK_INTERVAL
+            if self.state is None or self.state.is_game_over or self.state.is_paused:
+                continue
+            self.state = tick(self.state, self.config)
+            steps += 1
+        if self._sim_time_debt >= TICK_INTERVAL:
+            # Too far behind to catch up; drop the missed ticks
+            self._sim_time_debt = 0.0
+
+        # Scheduling against the remaining debt keeps timer latency from accumulating
+        self._game_timer = self.set_timer(
+            max(0.0, TICK_INTERVAL - self._sim_time_debt),
             self._game_tick,
         )
 
-    def _game_tick(self) -> None:
-        if self.state is None or self.state.is_game_over or self.state.is_paused:
-            return
-        self.state = tick(self.state, self.config)
-        self._update_widgets()
-        if self.state.is_game_over and self._game_timer:
-            self._game_timer.pause()
+        if steps:
+            self._update_widgets()
+            if self.state.is_game_over:
+                self._pause_game_loop()
 
     def _update_widgets(self) -> None:
-        if self.state is None:
+        if self.state is None or self.state is self._last_rendered_state:
             return
+        self._last_rendered_state = self.state
             
         if self._hud:
             self._hud.update_state(
@@ -261,18 +315,16 @@ class SnakeApp(App):
         if self.state:
             high_score = self.state.high_score
             self.state = create_initial_state(self.config, high_score=high_score)
-            if self._game_timer:
-                self._game_timer.resume()
+            self._resume_game_loop()
             self._update_widgets()
 
     def action_pause(self) -> None:
         if self.state:
             self.state = toggle_pause(self.state)
-            if self._game_timer:
-                if self.state.is_paused:
-                    self._game_timer.pause()
-                else:
-                    self._game_timer.resume()
+            if self.state.is_paused:
+                self._pause_game_loop()
+            else:
+                self._resume_game_loop()
             self._update_widgets()
 
     def action_toggle_theme(self) -> None:
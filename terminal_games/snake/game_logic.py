@@ -1,5 +1,6 @@
 import random
-from typing import Optional
+from collections import deque
+from typing import Iterable, Optional
 from .models import (
     Position,
     Snake,
@@ -11,76 +12,71 @@ from .models import (
 )
 def create_initial_state(config: BoardConfig, high_score: int = 0) -> GameState:
     center = Position(config.columns // 2, config.rows // 2)
-    initial_cells = tuple(
+    initial_cells = deque(
         Position(center.x - i, center.y) for i in range(6)
     )
     snake = Snake(
         head=center,
         velocity=Position(1, 0),  
         cells=initial_cells,
+        body_set=set(initial_cells) - {center},
         max_cells=6,
+        occupied_bits=occupancy_bits(initial_cells, config),
     )
-    apple = spawn_apple(snake.cells, config)
+    apple = spawn_apple(snake.occupied_bits, config)
     return GameState(snake=snake, apple=apple, high_score=high_score)
+def occupancy_bits(cells: Iterable[Position], config: BoardConfig) -> int:
+    bits = 0
+    for cell in cells:
+        bits |= 1 << (cell.y * config.columns + cell.x)
+    return bits
 def spawn_apple(
-    occupied_cells: tuple[Position, ...],
+    occupied_bits: int,
     config: BoardConfig,
     max_attempts: int = 512,
 ) -> Position:
-    occupied_set = set(occupied_cells)
+    columns = config.columns
     for _ in range(max_attempts):
-        pos = Position(
-            random.randint(0, config.columns - 1),
-            random.randint(0, config.rows - 1),
-        )
-        if pos not in occupied_set:
-            return pos
-    all_positions = {
-        Position(x, y)
-        for x in range(config.columns)
-        for y in range(config.rows)
-    }
-    free = all_positions - occupied_set
-    return next(iter(free)) if free else Position(0, 0)
-def wrap_position(pos: Position, config: BoardConfig) -> Position:
-    return Position(
-        pos.x % config.columns,
-        pos.y % config.rows,
-    )
+        x = random.randint(0, columns - 1)
+        y = random.randint(0, config.rows - 1)
+        if not (occupied_bits >> (y * columns + x)) & 1:
+            return Position(x, y)
+    free = ((1 << (columns * config.rows)) - 1) & ~occupied_bits
+    if not free:
+        return Position(0, 0)
+    key = (free & -free).bit_length() - 1
+    return Position(key % columns, key // columns)
 def can_change_direction(current: Direction, target: Direction) -> bool:
     return OPPOSITE_DIRECTIONS[current] != target
 def update_snake(
     snake: Snake,
     config: BoardConfig,
 ) -> tuple[Snake, Optional[Position]]:
-    new_head = wrap_position(snake.head + snake.velocity, config)
-    new_cells = (new_head,) + snake.cells
+    columns = config.columns
+    head = snake.head
+    velocity = snake.velocity
+    # Wrap the raw coordinates so a tick allocates a single Position
+    x = (head.x + velocity.x) % columns
+    y = (head.y + velocity.y) % config.rows
+    new_head = Position(x, y)
+    snake.cells.appendleft(new_head)
+    snake.body_set.add(head)
+    snake.head = new_head
+    bits = snake.occupied_bits
     old_tail: Optional[Position] = None
-    if len(new_cells) > snake.max_cells:
-        old_tail = new_cells[-1]
-        new_cells = new_cells[:-1]
-    return (
-        Snake(
-            head=new_head,
-            velocity=snake.velocity,
-            cells=new_cells,
-            max_cells=snake.max_cells,
-        ),
-        old_tail,
-    )
+    if len(snake.cells) > snake.max_cells:
+        old_tail = snake.cells.pop()
+        snake.body_set.discard(old_tail)
+        bits &= ~(1 << (old_tail.y * columns + old_tail.x))
+    snake.occupied_bits = bits | (1 << (y * columns + x))
+    return snake, old_tail
 def check_self_collision(snake: Snake) -> bool:
-    if len(snake.cells) < 2:
-        return False
-    return snake.head in snake.cells[1:]
+    return snake.head in snake.body_set
 def check_apple_collision(snake: Snake, apple: Position) -> bool:
     return snake.head == apple
 def grow_snake(snake: Snake) -> Snake:
-    return Snake(
-        head=snake.head,
-        velocity=snake.velocity,
-        cells=snake.cells,
-        max_cells=snake.max_cells + 1,
-    )
+    snake.max_cells += 1
+    return snake
 def tick(state: GameState, config: BoardConfig) -> GameState:
     if state.is_paused or state.is_game_over:
         return state
@@ -99,7 +95,7 @@ def tick(state: GameState, config: BoardConfig) -> GameState:
     if check_apple_collision(new_snake, state.apple):
         new_snake = grow_snake(new_snake)
         new_score += 1
-        new_apple = spawn_apple(new_snake.cells, config)
+        new_apple = spawn_apple(new_snake.occupied_bits, config)
     new_high_score = max(state.high_score, new_score)
     return GameState(
         snake=new_snake,
@@ -115,11 +111,15 @@ def change_direction(state: GameState, new_direction: Direction) -> GameState:
     if not can_change_direction(state.snake.direction, new_direction):
         return state
     new_velocity = DIRECTION_VECTORS[new_direction]
+    if new_velocity == state.snake.velocity:
+        return state
     new_snake = Snake(
         head=state.snake.head,
         velocity=new_velocity,
         cells=state.snake.cells,
+        body_set=state.snake.body_set,
         max_cells=state.snake.max_cells,
+        occupied_bits=state.snake.occupied_bits,
     )
     return GameState(
         snake=new_snake,
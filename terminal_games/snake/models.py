@@ -1,25 +1,25 @@
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List
+from typing import List, NamedTuple
 class Direction(Enum):
     UP = auto()
     DOWN = auto()
     LEFT = auto()
     RIGHT = auto()
-@dataclass(frozen=True, slots=True)
-class Position:
+class Position(NamedTuple):
     x: int
     y: int
-    def __add__(self, other: "Position") -> "Position":
-        return Position(self.x + other.x, self.y + other.y)
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Snake:
     head: Position
     velocity: Position  
-    cells: tuple[Position, ...]  
+    # Advanced in place each tick; body_set mirrors every cell but the head
+    cells: deque[Position]
+    body_set: set[Position]
     max_cells: int = 6
+    # One bit per board cell, keyed by y * columns + x
+    occupied_bits: int = 0
     @property
     def direction(self) -> Direction:
         if self.velocity.x < 0:
@@ -29,11 +29,11 @@ class Snake:
         elif self.velocity.y < 0:
             return Direction.UP
         return Direction.DOWN
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoardConfig:
     columns: int = 40
     rows: int = 30
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     snake: Snake
     apple: Position
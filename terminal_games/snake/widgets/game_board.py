@@ -1,6 +1,9 @@
+from collections import deque
+from enum import IntEnum
+from itertools import islice
 from textual.widget import Widget
 from textual.strip import Strip
-from textual.geometry import Size
+from textual.geometry import Region, Size
 from rich.segment import Segment
 from rich.style import Style
 from ..models import Position, BoardConfig
@@ -19,6 +22,52 @@ CHARS = {
     "corner_br": "\u2518",
 }
 
+
+class CellKind(IntEnum):
+    HEAD = 0
+    BODY = 1
+    TAIL = 2
+    APPLE = 3
+    EMPTY = 4
+    BORDER = 5
+
+
+# Each board cell is drawn two columns wide
+CELL_TEXT: tuple[str, ...] = (
+    CHARS["snake_head"] + " ",
+    CHARS["snake_body"] + " ",
+    CHARS["snake_tail"] + " ",
+    CHARS["apple"] + " ",
+    CHARS["empty"] * 2,
+    CHARS["border_v"],
+)
+
+_DARK_BG = "#0a0a0a"
+_LIGHT_BG = "#e8e8e8"
+
+# Indexed by CellKind
+_DARK_STYLES: tuple[Style, ...] = (
+    Style(color="bright_white", bgcolor=_DARK_BG, bold=True),
+    Style(color="grey70", bgcolor=_DARK_BG),
+    Style(color="grey50", bgcolor=_DARK_BG),
+    Style(color="bright_red", bgcolor=_DARK_BG, bold=True),
+    Style(color="#1a1a1a", bgcolor=_DARK_BG),
+    Style(color="bright_cyan", bgcolor=_DARK_BG),
+)
+_LIGHT_STYLES: tuple[Style, ...] = (
+    Style(color="grey11", bgcolor=_LIGHT_BG, bold=True),
+    Style(color="grey35", bgcolor=_LIGHT_BG),
+    Style(color="grey58", bgcolor=_LIGHT_BG),
+    Style(color="red3", bgcolor=_LIGHT_BG, bold=True),
+    Style(color="#d0d0d0", bgcolor=_LIGHT_BG),
+    Style(color="dark_cyan", bgcolor=_LIGHT_BG),
+)
+
+
+# Ticks a single update can fold in before falling back to a rebuild
+MAX_STEPS_PER_UPDATE = 4
+
+
 class GameBoard(Widget):
     DEFAULT_CSS = """
     GameBoard {
@@ -34,62 +83,152 @@ class GameBoard(Widget):
     ) -> None:
         super().__init__(id=id)
         self.config = config or BoardConfig()
-        self._snake_cells: tuple[Position, ...] = ()
-        self._snake_set: dict[Position, str] = {}
+        self._snake_cells: deque[Position] = deque()
+        # Cells keyed by y * columns + x so rendering never builds Positions
+        self._snake_set: dict[int, CellKind] = {}
         self._apple: Position = Position(0, 0)
+        self._apple_key: int = 0
+        self._keyed_columns: int = 0
+        # Mirror of the snake's cell keys, head first, as of the last update
+        self._snake_keys: deque[int] = deque()
         self._is_game_over: bool = False
-        self._styles: dict[str, Style] = {}
+        self._styles: tuple[Style, ...] = ()
         self._last_theme: str | None = None
+        self._last_config: BoardConfig | None = None
+        # Rendered rows survive until a cell in them changes
+        self._row_cache: dict[int, Strip] = {}
+        self._border_v_segment = Segment(CHARS["border_v"])
+        self._top_strip = Strip([])
+        self._bottom_strip = Strip([])
 
     def update_state(
         self,
-        snake_cells: tuple[Position, ...],
+        snake_cells: deque[Position],
         apple: Position,
         is_game_over: bool,
     ) -> None:
+        cols = self.config.columns
+        dirty_keys = self._step_snake_set(snake_cells, cols)
         self._snake_cells = snake_cells
-        self._apple = apple
         self._is_game_over = is_game_over
-        
-        # O(N) preprocessing for O(1) lookup during render
-        self._snake_set.clear()
-        if snake_cells:
-            self._snake_set[snake_cells[0]] = "head"
-            for cell in snake_cells[1:-1]:
-                self._snake_set[cell] = "body"
-            if len(snake_cells) > 1:
-                self._snake_set[snake_cells[-1]] = "tail"
-        
-        self.refresh()
+        apple_key = apple.y * cols + apple.x
+
+        if dirty_keys is None:
+            # O(N) preprocessing for O(1) lookup during render
+            old_snake_set = self._snake_set
+            self._snake_keys = deque(cell.y * cols + cell.x for cell in snake_cells)
+            self._snake_set = {}
+            if snake_cells:
+                keys = self._snake_keys
+                self._snake_set[keys[0]] = CellKind.HEAD
+                for key in islice(keys, 1, len(keys) - 1):
+                    self._snake_set[key] = CellKind.BODY
+                if len(keys) > 1:
+                    self._snake_set[keys[-1]] = CellKind.TAIL
+            self._keyed_columns = cols
+
+            dirty_rows = {key // cols for key, _ in old_snake_set.items() ^ self._snake_set.items()}
+            dirty_rows.add(self._apple.y)
+            dirty_rows.add(apple.y)
+            self._apple = apple
+            self._apple_key = apple_key
+            for row_y in dirty_rows:
+                self._row_cache.pop(row_y, None)
+            self.refresh()
+            return
+
+        if apple_key != self._apple_key:
+            dirty_keys.append(self._apple_key)
+            dirty_keys.append(apple_key)
+            self._apple = apple
+            self._apple_key = apple_key
+        if dirty_keys:
+            for key in dirty_keys:
+                self._row_cache.pop(key // cols, None)
+            # Board content starts one row and one column in, inside the border
+            self.refresh(
+                *(Region(1 + (key % cols) * 2, 1 + key // cols, 2, 1) for key in dirty_keys)
+            )
+
+    def _step_snake_set(
+        self, snake_cells: deque[Position], cols: int
+    ) -> list[int] | None:
+        # The game advances the same deque in place; anything else is a rebuild
+        keys = self._snake_keys
+        if (
+            snake_cells is not self._snake_cells
+            or cols != self._keyed_columns
+            or len(snake_cells) < 2
+            or len(keys) < 2
+        ):
+            return None
+
+        # Count the heads pushed since the last update (several if ticks were batched)
+        prev_head_key = keys[0]
+        steps = 0
+        for cell in islice(snake_cells, MAX_STEPS_PER_UPDATE + 1):
+            if cell.y * cols + cell.x == prev_head_key:
+                break
+            steps += 1
+        else:
+            return None
+
+        length = len(snake_cells)
+        removed = len(keys) + steps - length
+        tail = snake_cells[-1]
+        tail_key = tail.y * cols + tail.x
+        if removed < 0 or removed >= len(keys) or keys[-1 - removed] != tail_key:
+            return None
+        if steps == 0:
+            return []
+
+        snake_set = self._snake_set
+        dirty_keys = [prev_head_key]
+        for _ in range(removed):
+            key = keys.pop()
+            snake_set.pop(key, None)
+            dirty_keys.append(key)
+        snake_set[prev_head_key] = CellKind.BODY
+        new_keys = [cell.y * cols + cell.x for cell in islice(snake_cells, steps)]
+        for key in reversed(new_keys[1:]):
+            keys.appendleft(key)
+            snake_set[key] = CellKind.BODY
+        head_key = new_keys[0]
+        keys.appendleft(head_key)
+        snake_set[tail_key] = CellKind.TAIL
+        # On a collision the body cell stays drawn over the head, as in a rebuild
+        snake_set.setdefault(head_key, CellKind.HEAD)
+        dirty_keys.extend(new_keys)
+        dirty_keys.append(tail_key)
+        return dirty_keys
 
     def _refresh_styles(self) -> None:
         current_theme = getattr(self.app, "theme", "textual-dark")
-        if self._styles and self._last_theme == current_theme:
+        if (
+            self._styles
+            and self._last_theme == current_theme
+            and self._last_config == self.config
+        ):
             return
 
         self._last_theme = current_theme
-        is_dark = current_theme == "textual-dark"
-
-        if is_dark:
-            bg_color = "#0a0a0a"
-            self._styles = {
-                "head": Style(color="bright_white", bgcolor=bg_color, bold=True),
-                "body": Style(color="grey70", bgcolor=bg_color),
-                "tail": Style(color="grey50", bgcolor=bg_color),
-                "apple": Style(color="bright_red", bgcolor=bg_color, bold=True),
-                "empty": Style(color="#1a1a1a", bgcolor=bg_color),
-                "border": Style(color="bright_cyan", bgcolor=bg_color),
-            }
-        else:
-            bg_color = "#e8e8e8"
-            self._styles = {
-                "head": Style(color="grey11", bgcolor=bg_color, bold=True),
-                "body": Style(color="grey35", bgcolor=bg_color),
-                "tail": Style(color="grey58", bgcolor=bg_color),
-                "apple": Style(color="red3", bgcolor=bg_color, bold=True),
-                "empty": Style(color="#d0d0d0", bgcolor=bg_color),
-                "border": Style(color="dark_cyan", bgcolor=bg_color),
-            }
+        self._last_config = self.config
+        self._styles = _DARK_STYLES if current_theme == "textual-dark" else _LIGHT_STYLES
+
+        border_style = self._styles[CellKind.BORDER]
+        border_h = CHARS["border_h"] * (self.config.columns * 2)
+        self._border_v_segment = Segment(CHARS["border_v"], border_style)
+        self._top_strip = Strip([
+            Segment(CHARS["corner_tl"], border_style),
+            Segment(border_h, border_style),
+            Segment(CHARS["corner_tr"], border_style),
+        ])
+        self._bottom_strip = Strip([
+            Segment(CHARS["corner_bl"], border_style),
+            Segment(border_h, border_style),
+            Segment(CHARS["corner_br"], border_style),
+        ])
+        self._row_cache.clear()
 
     def get_content_width(self, container: Size, viewport: Size) -> int:
         return (self.config.columns * 2) + 2
@@ -99,40 +238,45 @@ class GameBoard(Widget):
 
     def render_line(self, y: int) -> Strip:
         self._refresh_styles()
-        styles = self._styles
-        border_style = styles["border"]
-
-        segments: list[Segment] = []
 
         if y == 0:
-            segments.append(Segment(CHARS["corner_tl"], border_style))
-            segments.append(
-                Segment(CHARS["border_h"] * (self.config.columns * 2), border_style)
-            )
-            segments.append(Segment(CHARS["corner_tr"], border_style))
-            return Strip(segments)
+            return self._top_strip
 
         if y == self.config.rows + 1:
-            segments.append(Segment(CHARS["corner_bl"], border_style))
-            segments.append(
-                Segment(CHARS["border_h"] * (self.config.columns * 2), border_style)
-            )
-            segments.append(Segment(CHARS["corner_br"], border_style))
-            return Strip(segments)
+            return self._bottom_strip
 
         row_y = y - 1
-        segments.append(Segment(CHARS["border_v"], border_style))
+        cached = self._row_cache.get(row_y)
+        if cached is not None:
+            return cached
+
+        styles = self._styles
+        segments: list[Segment] = [self._border_v_segment]
         
-        for col_x in range(self.config.columns):
-            pos = Position(col_x, row_y)
-            if pos == self._apple:
-                segments.append(Segment(CHARS["apple"] + " ", styles["apple"]))
-            elif pos in self._snake_set:
-                part_type = self._snake_set[pos]
-                char_key = f"snake_{part_type}"
-                segments.append(Segment(CHARS[char_key] + " ", styles[part_type]))
+        # Merge runs of same-kind cells; an empty row collapses to one segment
+        snake_set = self._snake_set
+        apple_key = self._apple_key
+        base = row_y * self.config.columns
+        run_kind = CellKind.EMPTY
+        run_length = 0
+        for key in range(base, base + self.config.columns):
+            if key == apple_key:
+                kind = CellKind.APPLE
             else:
-                segments.append(Segment(CHARS["empty"] + " ", styles["empty"]))
+                kind = snake_set.get(key, CellKind.EMPTY)
+            if kind != run_kind:
+                if run_length:
+                    segments.append(
+                        Segment(CELL_TEXT[run_kind] * run_length, styles[run_kind])
+                    )
+                run_kind = kind
+                run_length = 0
+            run_length += 1
+        segments.append(
+            Segment(CELL_TEXT[run_kind] * run_length, styles[run_kind])
+        )
 
-        segments.append(Segment(CHARS["border_v"], border_style))
-        return Strip(segments)
+        segments.append(self._border_v_segment)
+        strip = Strip(segments)
+        self._row_cache[row_y] = strip
+        return strip
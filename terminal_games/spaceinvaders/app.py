@@ -1,23 +1,20 @@
 from dataclasses import replace
 from pathlib import Path
+from typing import Callable
 from textual.app import App, ComposeResult
 from textual import events
 from textual.binding import Binding
 from textual.containers import Container
 from textual.timer import Timer
 from textual.widgets import Footer, Header
-from .models import BoardConfig
+from .models import BoardConfig, Bullet, Enemy
 from .game_logic import (
     create_initial_state,
+    move_player,
     move_player_left,
     move_player_right,
     shoot_player_bullet,
-    update_player_bullets,
-    update_enemy_bullets,
-    update_enemies,
-    enemy_shoot,
-    check_collisions,
-    check_win,
+    advance_tick,
     toggle_pause,
     reset_shoot_cooldown,
     get_enemy_move_interval,
@@ -28,6 +25,13 @@ from .widgets.hud import HUD
 from ..config import get_theme, set_theme
 from .sprites import PLAYER_SPRITE
 TICK_INTERVAL = 0.05
+SHOOT_COOLDOWN_TICKS = round(0.25 / TICK_INTERVAL)
+PLAYER_WIDTH = len(PLAYER_SPRITE[0])
+ENEMY_WIDTH = 3
+ENEMY_HEIGHT = 2
+ENEMY_SPACING = 4
+ENEMY_ROW_SPACING = 3
+_KEY_TO_DIR = {"left": -1, "a": -1, "right": 1, "d": 1}
 class SpaceInvadersApp(App):
     CSS_PATH = Path(__file__).parent / "styles" / "spaceinvaders.tcss"
     ENABLE_COMMAND_PALETTE = False
@@ -50,11 +54,15 @@ class SpaceInvadersApp(App):
         self._board: GameBoard | None = None
         self._hud: HUD | None = None
         self._game_timer: Timer | None = None
-        self._shoot_cooldown_timer: Timer | None = None
+        self._resize_timer: Timer | None = None
         self._moving_left = False
         self._moving_right = False
-        self._enemy_move_accum = 0.0
-        self._enemy_shoot_accum = 0.0
+        # Everything periodic runs off the one game timer, counted in ticks
+        self._tick_count = 0
+        self._shoot_ready_tick = 0
+        self._enemy_steps = 0
+        self._last_fingerprint: tuple | None = None
+        self._last_hud_key: tuple | None = None
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Container(
@@ -72,46 +80,85 @@ class SpaceInvadersApp(App):
         self.theme = get_theme()
 
     def on_resize(self, event: events.Resize) -> None:
-        self._configure_layout()
+        # Coalesce bursts of resize events into a single layout pass
+        if self._resize_timer:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(0.1, self._configure_layout)
     def _start_timers(self) -> None:
-        self._reset_accumulators()
-        self._game_timer = self.set_interval(TICK_INTERVAL, self._game_tick)
+        self._reset_tick_counters()
+        self._game_timer = self.set_interval(TICK_INTERVAL, self._make_game_tick())
     def _stop_timers(self) -> None:
         if self._game_timer:
             self._game_timer.stop()
-        if self._shoot_cooldown_timer:
-            self._shoot_cooldown_timer.stop()
     def _restart_timers(self) -> None:
         self._stop_timers()
         self._start_timers()
-    def _game_tick(self) -> None:
-        if self.state.is_game_over or self.state.is_paused or self.state.is_won:
-            return
-        if self._moving_left:
-            self.state = move_player_left(self.state)
-        if self._moving_right:
-            self.state = move_player_right(self.state)
-        self._enemy_move_accum += TICK_INTERVAL
-        self._enemy_shoot_accum += TICK_INTERVAL
-
+    def _make_game_tick(self) -> Callable[[], None]:
+        # Level only changes through a reset, which restarts the timers and
+        # builds a new tick with that level's intervals baked in
         move_interval = get_enemy_move_interval(self.state.level)
-        if self._enemy_move_accum >= move_interval:
-            self.state = update_enemies(self.state)
-            self._enemy_move_accum -= move_interval
-
         shoot_interval = get_enemy_shoot_interval(self.state.level)
-        if self._enemy_shoot_accum >= shoot_interval:
-            self.state = enemy_shoot(self.state)
-            self._enemy_shoot_accum -= shoot_interval
+        next_move_at = move_interval
+        next_shoot_at = shoot_interval
 
-        self.state = update_player_bullets(self.state)
-        self.state = update_enemy_bullets(self.state)
-        self.state = check_collisions(self.state)
-        self.state = check_win(self.state)
-        self._update_widgets()
-    def _reset_shoot_cooldown(self) -> None:
-        self.state = reset_shoot_cooldown(self.state)
+        def game_tick() -> None:
+            nonlocal next_move_at, next_shoot_at
+            state = self.state
+            if state.is_game_over or state.is_paused or state.is_won:
+                return
+            self._tick_count += 1
+            elapsed = self._tick_count * TICK_INTERVAL
+            if not state.can_shoot and self._tick_count >= self._shoot_ready_tick:
+                state = reset_shoot_cooldown(state)
+            # Holding both directions cancels out, so it costs nothing
+            dx = int(self._moving_right) - int(self._moving_left)
+            if dx:
+                state = move_player(state, dx)
+
+            move_enemies = elapsed >= next_move_at
+            if move_enemies:
+                self._enemy_steps += 1
+                next_move_at += move_interval
+            enemies_shoot = elapsed >= next_shoot_at
+            if enemies_shoot:
+                next_shoot_at += shoot_interval
+
+            self.state = advance_tick(state, move_enemies, enemies_shoot)
+            # Idle frames (nothing moved, no bullets in flight) skip the repaint
+            if self._board_fingerprint() != self._last_fingerprint:
+                self._update_board()
+            # The HUD only changes on score, level or status changes
+            if self._hud_key() != self._last_hud_key:
+                self._update_hud()
+
+        return game_tick
+    def _board_fingerprint(self) -> tuple:
+        # Enemies only move on counted swarm steps and die for points (score)
+        state = self.state
+        return (
+            state.player.x,
+            self._enemy_steps,
+            state.player_bullets,
+            state.enemy_bullets,
+            state.score,
+            state.is_game_over,
+            state.is_won,
+        )
+    def _hud_key(self) -> tuple:
+        state = self.state
+        return (
+            state.level,
+            state.score,
+            state.high_score,
+            state.is_paused,
+            state.is_game_over,
+            state.is_won,
+        )
     def _update_widgets(self) -> None:
+        self._update_hud()
+        self._update_board()
+    def _update_hud(self) -> None:
+        self._last_hud_key = self._hud_key()
         if self._hud:
             self._hud.update_state(
                 level=self.state.level,
@@ -121,9 +168,9 @@ class SpaceInvadersApp(App):
                 is_game_over=self.state.is_game_over,
                 is_won=self.state.is_won,
             )
+    def _update_board(self) -> None:
+        self._last_fingerprint = self._board_fingerprint()
         if self._board:
-            if self.config:
-                self._board.set_config(self.config)
             self._board.update_state(
                 player=self.state.player,
                 enemies=self.state.enemies,
@@ -132,17 +179,18 @@ class SpaceInvadersApp(App):
                 is_game_over=self.state.is_game_over,
                 is_won=self.state.is_won,
             )
-    def on_key(self, event) -> None:
-        if event.key == "left" or event.key == "a":
+    def on_key(self, event: events.Key) -> None:
+        direction = _KEY_TO_DIR.get(event.key)
+        if direction == -1:
             self._moving_left = True
-        elif event.key == "right" or event.key == "d":
+        elif direction == 1:
             self._moving_right = True
-    def on_key_up(self, event) -> None:
-        if hasattr(event, 'key'):
-            if event.key == "left" or event.key == "a":
-                self._moving_left = False
-            elif event.key == "right" or event.key == "d":
-                self._moving_right = False
+    def on_key_up(self, event: events.Key) -> None:
+        direction = _KEY_TO_DIR.get(event.key)
+        if direction == -1:
+            self._moving_left = False
+        elif direction == 1:
+            self._moving_right = False
     def action_move_left(self) -> None:
         if self.state.is_game_over or self.state.is_paused or self.state.is_won:
             return
@@ -159,9 +207,7 @@ class SpaceInvadersApp(App):
         if self.state.can_shoot:
             self.state = shoot_player_bullet(self.state)
             self._update_widgets()
-            if self._shoot_cooldown_timer:
-                self._shoot_cooldown_timer.stop()
-            self._shoot_cooldown_timer = self.set_timer(0.25, self._reset_shoot_cooldown)
+            self._shoot_ready_tick = self._tick_count + SHOOT_COOLDOWN_TICKS
     def action_pause(self) -> None:
         self.state = toggle_pause(self.state)
         self._update_widgets()
@@ -201,27 +247,21 @@ class SpaceInvadersApp(App):
         board_width = max(50, screen_width - 6)
         board_height = max(24, screen_height - 10)
 
-        player_width = len(PLAYER_SPRITE[0])
         player_y = max(6, board_height - 3)
-
-        enemy_width = 3
-        enemy_height = 2
-        enemy_spacing = 4
-        enemy_row_spacing = 3
-        max_cols = (board_width + enemy_spacing) // (enemy_width + enemy_spacing)
+        max_cols = (board_width + ENEMY_SPACING) // (ENEMY_WIDTH + ENEMY_SPACING)
         enemy_cols = min(8, max(2, max_cols))
 
         return BoardConfig(
             width=board_width,
             height=board_height,
             player_y=player_y,
-            player_width=player_width,
+            player_width=PLAYER_WIDTH,
             enemy_rows=3,
             enemy_cols=enemy_cols,
-            enemy_width=enemy_width,
-            enemy_height=enemy_height,
-            enemy_spacing=enemy_spacing,
-            enemy_row_spacing=enemy_row_spacing,
+            enemy_width=ENEMY_WIDTH,
+            enemy_height=ENEMY_HEIGHT,
+            enemy_spacing=ENEMY_SPACING,
+            enemy_row_spacing=ENEMY_ROW_SPACING,
         )
 
     def _configure_layout(self, force_reset: bool = False) -> None:
@@ -253,15 +293,14 @@ class SpaceInvadersApp(App):
 
         if self._board:
             self._board.set_config(self.config)
-            self._board.refresh()
 
         if self._game_timer:
             self._restart_timers()
         self._update_widgets()
 
-    def _reset_accumulators(self) -> None:
-        self._enemy_move_accum = 0.0
-        self._enemy_shoot_accum = 0.0
+    def _reset_tick_counters(self) -> None:
+        self._tick_count = 0
+        self._shoot_ready_tick = 0
 
     def _map_state_to_new_config(
         self,
@@ -269,19 +308,34 @@ class SpaceInvadersApp(App):
         old_config: BoardConfig,
         new_config: BoardConfig,
     ):
-        desired_dx = (new_config.width - old_config.width) // 2
+        width = new_config.width
+        height = new_config.height
+        max_enemy_x = width - new_config.enemy_width
+        max_enemy_y = height - new_config.enemy_height
+        desired_dx = (width - old_config.width) // 2
         desired_dy = new_config.player_y - old_config.player_y
 
         if state.enemies:
-            min_x = min(e.x for e in state.enemies)
-            max_x = max(e.x + old_config.enemy_width - 1 for e in state.enemies)
-            min_y = min(e.y for e in state.enemies)
-            max_y = max(e.y + old_config.enemy_height - 1 for e in state.enemies)
+            # One pass for all four bounds
+            first = state.enemies[0]
+            min_x = max_x = first.x
+            min_y = max_y = first.y
+            for enemy in state.enemies:
+                if enemy.x < min_x:
+                    min_x = enemy.x
+                elif enemy.x > max_x:
+                    max_x = enemy.x
+                if enemy.y < min_y:
+                    min_y = enemy.y
+                elif enemy.y > max_y:
+                    max_y = enemy.y
+            max_x += old_config.enemy_width - 1
+            max_y += old_config.enemy_height - 1
 
             dx_min = -min_x
-            dx_max = (new_config.width - 1) - max_x
+            dx_max = (width - 1) - max_x
             dy_min = -min_y
-            dy_max = (new_config.height - 1) - max_y
+            dy_max = (height - 1) - max_y
 
             dx = max(dx_min, min(dx_max, desired_dx))
             dy = max(dy_min, min(dy_max, desired_dy))
@@ -290,38 +344,39 @@ class SpaceInvadersApp(App):
             dy = desired_dy
 
         player_x = state.player.x + dx
-        player_x = max(0, min(new_config.width - new_config.player_width, player_x))
+        player_x = max(0, min(width - new_config.player_width, player_x))
         new_player = replace(state.player, x=player_x)
 
         new_enemies = []
         for enemy in state.enemies:
-            new_x = enemy.x + dx
-            new_y = enemy.y + dy
-            new_x = max(0, min(new_config.width - new_config.enemy_width, new_x))
-            new_y = max(0, min(new_config.height - new_config.enemy_height, new_y))
-            new_enemies.append(replace(enemy, x=new_x, y=new_y))
-
-        new_player_bullets = []
-        for bullet in state.player_bullets:
-            new_x = bullet.x + dx
-            new_y = bullet.y + dy
-            if 0 <= new_x < new_config.width and 0 <= new_y < new_config.height:
-                new_player_bullets.append(replace(bullet, x=new_x, y=new_y))
-
-        new_enemy_bullets = []
-        for bullet in state.enemy_bullets:
-            new_x = bullet.x + dx
-            new_y = bullet.y + dy
-            if 0 <= new_x < new_config.width and 0 <= new_y < new_config.height:
-                new_enemy_bullets.append(replace(bullet, x=new_x, y=new_y))
+            new_x = max(0, min(max_enemy_x, enemy.x + dx))
+            new_y = max(0, min(max_enemy_y, enemy.y + dy))
+            new_enemies.append(
+                Enemy(new_x, new_y, enemy.enemy_type, enemy.active, enemy.width, enemy.height)
+            )
 
         return replace(
             state,
             config=new_config,
             player=new_player,
             enemies=tuple(new_enemies),
-            player_bullets=tuple(new_player_bullets),
-            enemy_bullets=tuple(new_enemy_bullets),
+            player_bullets=self._shift_bullets(state.player_bullets, dx, dy, width, height),
+            enemy_bullets=self._shift_bullets(state.enemy_bullets, dx, dy, width, height),
+        )
+
+    def _shift_bullets(
+        self,
+        bullets: tuple[Bullet, ...],
+        dx: int,
+        dy: int,
+        width: int,
+        height: int,
+    ) -> tuple[Bullet, ...]:
+        # Bullets pushed off the resized board are dropped
+        return tuple(
+            Bullet(bullet.x + dx, bullet.y + dy, bullet.active, bullet.is_enemy)
+            for bullet in bullets
+            if 0 <= bullet.x + dx < width and 0 <= bullet.y + dy < height
         )
 def main() -> None:
     app = SpaceInvadersApp()
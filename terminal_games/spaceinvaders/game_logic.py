@@ -1,5 +1,6 @@
 import random
 from dataclasses import replace
+from functools import lru_cache
 from .models import (
     Player,
     Bullet,
@@ -7,6 +8,11 @@ from .models import (
     GameState,
     BoardConfig,
 )
+# Below this many enemies + bullets a plain pairwise scan is cheaper than hashing
+GRID_MIN_OBJECTS = 32
+# Multipliers for hashing a 2D grid cell to one int key (Teschner et al.)
+_HASH_X = 73856093
+_HASH_Y = 19349663
 def create_initial_state(
     level: int = 1,
     high_score: int = 0,
@@ -19,6 +25,7 @@ def create_initial_state(
         config=board_config,
         player=player,
         enemies=enemies,
+        active_count=len(enemies),
         player_bullets=(),
         enemy_bullets=(),
         score=0,
@@ -50,19 +57,19 @@ def init_enemies(config: BoardConfig) -> tuple[Enemy, ...]:
             y = start_y + row * (config.enemy_height + config.enemy_row_spacing)
             enemies.append(Enemy(x=x, y=y, enemy_type=enemy_type))
     return tuple(enemies)
-def move_player_left(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    new_x = max(0, state.player.x - 2)
-    new_player = replace(state.player, x=new_x)
-    return replace(state, player=new_player)
-def move_player_right(state: GameState) -> GameState:
+def move_player(state: GameState, direction: int) -> GameState:
     if state.is_game_over or state.is_paused:
         return state
     max_x = state.config.width - state.config.player_width
-    new_x = min(max_x, state.player.x + 2)
+    new_x = max(0, min(max_x, state.player.x + 2 * direction))
+    if new_x == state.player.x:
+        return state
     new_player = replace(state.player, x=new_x)
     return replace(state, player=new_player)
+def move_player_left(state: GameState) -> GameState:
+    return move_player(state, -1)
+def move_player_right(state: GameState) -> GameState:
+    return move_player(state, 1)
 def shoot_player_bullet(state: GameState) -> GameState:
     if state.is_game_over or state.is_paused or not state.can_shoot:
         return state
@@ -74,108 +81,148 @@ def shoot_player_bullet(state: GameState) -> GameState:
         player_bullets=state.player_bullets + (new_bullet,),
         can_shoot=False,
     )
-def update_player_bullets(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    new_bullets = tuple(
-        replace(bullet, y=bullet.y - 1)
-        for bullet in state.player_bullets
-        if bullet.active and bullet.y - 1 >= 0
+def _step_player_bullets(bullets: tuple[Bullet, ...]) -> tuple[Bullet, ...]:
+    # Only active bullets survive, so they are built directly rather than via replace
+    return tuple(
+        Bullet(bullet.x, bullet.y - 1, True, bullet.is_enemy)
+        for bullet in bullets
+        if bullet.active and bullet.y >= 1
     )
-    return replace(state, player_bullets=new_bullets)
-def update_enemy_bullets(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    new_bullets = tuple(
-        replace(bullet, y=bullet.y + 1)
-        for bullet in state.enemy_bullets
-        if bullet.active and bullet.y + 1 < state.config.height
+def _step_enemy_bullets(bullets: tuple[Bullet, ...], height: int) -> tuple[Bullet, ...]:
+    last_y = height - 2
+    return tuple(
+        Bullet(bullet.x, bullet.y + 1, True, bullet.is_enemy)
+        for bullet in bullets
+        if bullet.active and bullet.y <= last_y
     )
-    return replace(state, enemy_bullets=new_bullets)
-def update_enemies(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    active_enemies = [e for e in state.enemies if e.active]
-    if not active_enemies:
-        return state
-    hit_edge = False
-    for enemy in active_enemies:
-        if state.direction == 1:  
-            if enemy.x + state.config.enemy_width >= state.config.width - 1:
-                hit_edge = True
-                break
-        else:  
-            if enemy.x <= 1:
-                hit_edge = True
-                break
-    if hit_edge:
-        new_direction = state.direction * -1
-        new_enemies = tuple(
-            replace(e, y=e.y + 1) if e.active else e
-            for e in state.enemies
-        )
-        for enemy in new_enemies:
-            if (
-                enemy.active
-                and enemy.y + state.config.enemy_height >= state.config.player_y
-            ):
-                return replace(
-                    state,
-                    enemies=new_enemies,
-                    direction=new_direction,
-                    is_game_over=True,
-                    high_score=max(state.high_score, state.score),
-                )
-        return replace(state, enemies=new_enemies, direction=new_direction)
+def _step_enemies(state: GameState) -> tuple[tuple[Enemy, ...], int, bool]:
+    config = state.config
+    direction = state.direction
+    # Only the leading column of the swarm can reach a wall
+    if direction == 1:
+        edge_x = max(e.x for e in state.enemies if e.active)
+        hit_edge = edge_x + config.enemy_width >= config.width - 1
     else:
+        edge_x = min(e.x for e in state.enemies if e.active)
+        hit_edge = edge_x <= 1
+    # The swarm shifts as a block; building Enemy directly skips the
+    # per-call field introspection of dataclasses.replace
+    if hit_edge:
         new_enemies = tuple(
-            replace(e, x=e.x + state.direction) if e.active else e
+            Enemy(e.x, e.y + 1, e.enemy_type, True, e.width, e.height) if e.active else e
             for e in state.enemies
         )
-        return replace(state, enemies=new_enemies)
-def enemy_shoot(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    active_enemies = [e for e in state.enemies if e.active]
-    if not active_enemies:
-        return state
-    shooter = random.choice(active_enemies)
+        lowest_y = max(e.y for e in new_enemies if e.active)
+        return new_enemies, direction * -1, lowest_y + config.enemy_height >= config.player_y
+    new_enemies = tuple(
+        Enemy(e.x + direction, e.y, e.enemy_type, True, e.width, e.height) if e.active else e
+        for e in state.enemies
+    )
+    return new_enemies, direction, False
+def _enemy_bullet(enemies: tuple[Enemy, ...], state: GameState) -> Bullet:
+    # Pick the k-th live enemy in one walk instead of listing them all
+    remaining = random.randrange(state.active_count)
+    for shooter in enemies:
+        if shooter.active:
+            if not remaining:
+                break
+            remaining -= 1
     bullet_x = shooter.x + state.config.enemy_width // 2
     bullet_y = shooter.y + state.config.enemy_height
-    new_bullet = Bullet(x=bullet_x, y=bullet_y, is_enemy=True)
+    return Bullet(x=bullet_x, y=bullet_y, is_enemy=True)
+def advance_tick(
+    state: GameState,
+    move_enemies: bool = False,
+    enemies_shoot: bool = False,
+) -> GameState:
+    # The whole tick after player input: an optional swarm step and enemy
+    # shot, bullet movement, collisions and the win check, building a single
+    # new GameState instead of one per stage
+    if state.is_game_over or state.is_paused:
+        return state
+    enemies = state.enemies
+    direction = state.direction
+    enemy_bullets = state.enemy_bullets
+    if move_enemies and state.active_count:
+        enemies, direction, landed = _step_enemies(state)
+        if landed:
+            return replace(
+                state,
+                enemies=enemies,
+                direction=direction,
+                is_game_over=True,
+                high_score=max(state.high_score, state.score),
+            )
+    if enemies_shoot and state.active_count:
+        enemy_bullets = enemy_bullets + (_enemy_bullet(enemies, state),)
+    # With nothing in flight there is nothing to move or hit
+    if not state.player_bullets and not enemy_bullets and state.active_count:
+        if enemies is state.enemies:
+            return state
+        return replace(state, enemies=enemies, direction=direction)
+    enemies, player_bullets, enemy_bullets, kills, player_hit = _resolve_collisions(
+        state,
+        enemies,
+        _step_player_bullets(state.player_bullets),
+        _step_enemy_bullets(enemy_bullets, state.config.height),
+    )
+    new_score = state.score + kills * get_score_per_enemy(state.level)
+    active_count = state.active_count - kills
     return replace(
         state,
-        enemy_bullets=state.enemy_bullets + (new_bullet,),
+        enemies=enemies,
+        direction=direction,
+        active_count=active_count,
+        player_bullets=player_bullets,
+        enemy_bullets=enemy_bullets,
+        score=new_score,
+        high_score=max(state.high_score, new_score),
+        is_game_over=player_hit,
+        is_won=not player_hit and active_count == 0,
     )
-def check_collisions(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    player_bullet_active = list(state.player_bullets)
-    enemies_active = list(state.enemies)
-    score_delta = 0
+def _resolve_collisions(
+    state: GameState,
+    enemies: tuple[Enemy, ...],
+    player_bullets: tuple[Bullet, ...],
+    enemy_bullets: tuple[Bullet, ...],
+) -> tuple[tuple[Enemy, ...], tuple[Bullet, ...], tuple[Bullet, ...], int, bool]:
+    player_bullet_active = list(player_bullets)
+    enemies_active = list(enemies)
+    enemy_width = state.config.enemy_width
+    enemy_height = state.config.enemy_height
+    use_grid = len(enemies_active) + len(player_bullet_active) >= GRID_MIN_OBJECTS
+    grid = _build_enemy_grid(enemies_active, enemy_width, enemy_height) if use_grid else {}
+    all_enemies = range(len(enemies_active))
+    kills = 0
     for i, bullet in enumerate(player_bullet_active):
         if not bullet.active:
             continue
-        for j, enemy in enumerate(enemies_active):
+        if use_grid:
+            # Cells are one enemy in size, so a bullet only ever needs its own
+            candidates = grid.get(
+                (bullet.x // enemy_width * _HASH_X) ^ (bullet.y // enemy_height * _HASH_Y),
+                (),
+            )
+        else:
+            candidates = all_enemies
+        for j in candidates:
+            enemy = enemies_active[j]
             if not enemy.active:
                 continue
             if (
-                enemy.x <= bullet.x < enemy.x + state.config.enemy_width
-                and enemy.y <= bullet.y < enemy.y + state.config.enemy_height
+                enemy.x <= bullet.x < enemy.x + enemy_width
+                and enemy.y <= bullet.y < enemy.y + enemy_height
             ):
                 player_bullet_active[i] = replace(bullet, active=False)
                 enemies_active[j] = replace(enemy, active=False)
-                score_delta += 10 + state.level * 2
+                kills += 1
                 break
-    new_score = state.score + score_delta
-    new_high_score = max(state.high_score, new_score)
     new_player_bullets = tuple(b for b in player_bullet_active if b.active)
-    new_enemies = tuple(enemies_active)
     player_left = state.player.x
     player_right = state.player.x + state.config.player_width
     player_top = state.config.player_y
     player_bottom = state.config.player_y + 2
-    enemy_bullets_active = list(state.enemy_bullets)
+    enemy_bullets_active = list(enemy_bullets)
     player_hit = False
     for i, bullet in enumerate(enemy_bullets_active):
         if not bullet.active:
@@ -186,39 +233,41 @@ def check_collisions(state: GameState) -> GameState:
             enemy_bullets_active[i] = replace(bullet, active=False)
             break
     new_enemy_bullets = tuple(b for b in enemy_bullets_active if b.active)
-    if player_hit:
-        return replace(
-            state,
-            enemies=new_enemies,
-            player_bullets=new_player_bullets,
-            enemy_bullets=new_enemy_bullets,
-            score=new_score,
-            high_score=new_high_score,
-            is_game_over=True,
-        )
-    return replace(
-        state,
-        enemies=new_enemies,
-        player_bullets=new_player_bullets,
-        enemy_bullets=new_enemy_bullets,
-        score=new_score,
-        high_score=new_high_score,
+    return (
+        tuple(enemies_active),
+        new_player_bullets,
+        new_enemy_bullets,
+        kills,
+        player_hit,
     )
-def check_win(state: GameState) -> GameState:
-    if state.is_game_over or state.is_paused:
-        return state
-    active_enemies = [e for e in state.enemies if e.active]
-    if not active_enemies:
-        return replace(state, is_won=True)
-    return state
+def _build_enemy_grid(
+    enemies: list[Enemy], cell_width: int, cell_height: int
+) -> dict[int, list[int]]:
+    # Maps hashed grid cells to enemy indices. Each enemy goes in every cell its footprint overlaps (at most 2x2), and
+    # buckets fill in formation order so the first hit matches a pairwise scan
+    grid: dict[int, list[int]] = {}
+    for j, enemy in enumerate(enemies):
+        if not enemy.active:
+            continue
+        for cy in range(enemy.y // cell_height, (enemy.y + cell_height - 1) // cell_height + 1):
+            for cx in range(enemy.x // cell_width, (enemy.x + cell_width - 1) // cell_width + 1):
+                key = (cx * _HASH_X) ^ (cy * _HASH_Y)
+                bucket = grid.get(key)
+                if bucket is None:
+                    grid[key] = [j]
+                elif bucket[-1] != j:
+                    bucket.append(j)
+    return grid
 def toggle_pause(state: GameState) -> GameState:
     if state.is_game_over or state.is_won:
         return state
     return replace(state, is_paused=not state.is_paused)
 def reset_shoot_cooldown(state: GameState) -> GameState:
     return replace(state, can_shoot=True)
+@lru_cache(maxsize=8)
 def get_enemy_move_interval(level: int) -> float:
     return max(0.16, 0.4 - (level - 1) * 0.03)
+@lru_cache(maxsize=8)
 def get_enemy_shoot_interval(level: int) -> float:
     return max(0.5, 1.2 - (level - 1) * 0.1)
 def get_score_per_enemy(level: int) -> int:
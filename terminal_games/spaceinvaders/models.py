@@ -14,13 +14,13 @@ DEFAULT_ENEMY_ROW_SPACING = 3
 class Player:
     x: int  
     width: int = 5  
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bullet:
     x: int
     y: int
     active: bool = True
     is_enemy: bool = False  
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Enemy:
     x: int
     y: int
@@ -46,6 +46,8 @@ class GameState:
     config: BoardConfig
     player: Player
     enemies: tuple[Enemy, ...] = ()
+    # Enemies still alive; kept in step with enemies so nothing has to rescan them
+    active_count: int = 0
     player_bullets: tuple[Bullet, ...] = ()
     enemy_bullets: tuple[Bullet, ...] = ()
     score: int = 0
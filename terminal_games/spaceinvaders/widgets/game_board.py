@@ -1,3 +1,5 @@
+from enum import IntEnum
+from functools import lru_cache
 from rich.segment import Segment
 from rich.style import Style
 from textual.strip import Strip
@@ -11,6 +13,71 @@ from ..models import (
 from ..sprites import PLAYER_SPRITE, ENEMY_SPRITES, PLAYER_BULLET, ENEMY_BULLET
 
 
+class StyleSlot(IntEnum):
+    BG = 0
+    PLAYER = 1
+    ENEMY0 = 2
+    ENEMY1 = 3
+    ENEMY2 = 4
+    PLAYER_BULLET = 5
+    ENEMY_BULLET = 6
+
+
+ENEMY_STYLE_SLOTS = {
+    enemy_type: StyleSlot.ENEMY0 + enemy_type for enemy_type in ENEMY_SPRITES
+}
+
+# Styles are immutable, so every board shares one set per theme
+@lru_cache(maxsize=4)
+def _theme_styles(theme: str) -> tuple[Style, ...]:
+    if theme == "textual-dark":
+        colors = {
+            "bg": "#0a0a0a",
+            "player": "#00ff00",
+            "enemy0": "#ff0000",
+            "enemy1": "#ff6600",
+            "enemy2": "#ffff00",
+            "player_bullet": "#00ffff",
+            "enemy_bullet": "#ff00ff",
+        }
+    else:
+        colors = {
+            "bg": "#f0f0f0",
+            "player": "#006600",
+            "enemy0": "#cc0000",
+            "enemy1": "#cc5500",
+            "enemy2": "#999900",
+            "player_bullet": "#006699",
+            "enemy_bullet": "#990099",
+        }
+
+    # Indexed by StyleSlot
+    return (
+        Style(bgcolor=colors["bg"]),
+        Style(color=colors["player"], bgcolor=colors["bg"], bold=True),
+        Style(color=colors["enemy0"], bgcolor=colors["bg"], bold=True),
+        Style(color=colors["enemy1"], bgcolor=colors["bg"], bold=True),
+        Style(color=colors["enemy2"], bgcolor=colors["bg"], bold=True),
+        Style(color=colors["player_bullet"], bgcolor=colors["bg"], bold=True),
+        Style(color=colors["enemy_bullet"], bgcolor=colors["bg"], bold=True),
+    )
+
+
+def _stamp(
+    line_buffer: list[str],
+    style_buffer: bytearray,
+    x: int,
+    text: str,
+    slot: int,
+) -> None:
+    # Clip to the line, then copy the whole sprite row with slice assignment
+    start = max(x, 0)
+    end = min(x + len(text), len(line_buffer))
+    if start < end:
+        line_buffer[start:end] = text[start - x:end - x]
+        style_buffer[start:end] = bytes((slot,)) * (end - start)
+
+
 class GameBoard(Widget):
     DEFAULT_CSS = """
     GameBoard {
@@ -34,8 +101,13 @@ class GameBoard(Widget):
         self._enemy_bullets: list[Bullet] = []
         self._is_game_over: bool = False
         self._is_won: bool = False
-        self._styles: dict[str, Style] = {}
+        self._styles: tuple[Style, ...] = ()
         self._last_theme: str | None = None
+        # (x, text, StyleSlot) stamps bucketed by the board row they cover,
+        # so a line only visits what is drawn on it
+        self._enemy_rows: list[list[tuple[int, str, int]]] = []
+        self._bullet_rows: list[list[tuple[int, str, int]]] = []
+        self._index_rows()
 
     def update_state(
         self,
@@ -52,11 +124,44 @@ class GameBoard(Widget):
         self._enemy_bullets = enemy_bullets
         self._is_game_over = is_game_over
         self._is_won = is_won
+        self._index_rows()
         self.refresh()
 
     def set_config(self, config: BoardConfig) -> None:
+        if config == self._config:
+            return
         self._config = config
-        self.refresh()
+        self._index_rows()
+        # The board's content size follows the config
+        self.refresh(layout=True)
+
+    def _index_rows(self) -> None:
+        height = self._config.height
+        width = self._config.width
+        enemy_height = self._config.enemy_height
+        enemy_rows: list[list[tuple[int, str, int]]] = [[] for _ in range(height)]
+        bullet_rows: list[list[tuple[int, str, int]]] = [[] for _ in range(height)]
+
+        for enemy in self._enemies:
+            if not enemy.active:
+                continue
+            sprite = ENEMY_SPRITES.get(enemy.enemy_type, ENEMY_SPRITES[0])
+            slot = ENEMY_STYLE_SLOTS[enemy.enemy_type]
+            last_row = min(enemy.y + min(enemy_height, len(sprite)), height)
+            for row in range(max(enemy.y, 0), last_row):
+                enemy_rows[row].append((enemy.x, sprite[row - enemy.y], slot))
+
+        # Enemy bullets go in after player bullets so they win a shared cell
+        for bullets, char, slot in (
+            (self._player_bullets, PLAYER_BULLET, StyleSlot.PLAYER_BULLET),
+            (self._enemy_bullets, ENEMY_BULLET, StyleSlot.ENEMY_BULLET),
+        ):
+            for bullet in bullets:
+                if bullet.active and 0 <= bullet.y < height and 0 <= bullet.x < width:
+                    bullet_rows[bullet.y].append((bullet.x, char, slot))
+
+        self._enemy_rows = enemy_rows
+        self._bullet_rows = bullet_rows
 
     def get_content_width(self, container, viewport):
         return self._config.width
@@ -70,104 +175,55 @@ class GameBoard(Widget):
             return
 
         self._last_theme = current_theme
-        is_dark = current_theme == "textual-dark"
-
-        if is_dark:
-            colors = {
-                "bg": "#0a0a0a",
-                "player": "#00ff00",
-                "enemy0": "#ff0000",
-                "enemy1": "#ff6600",
-                "enemy2": "#ffff00",
-                "player_bullet": "#00ffff",
-                "enemy_bullet": "#ff00ff",
-            }
-        else:
-            colors = {
-                "bg": "#f0f0f0",
-                "player": "#006600",
-                "enemy0": "#cc0000",
-                "enemy1": "#cc5500",
-                "enemy2": "#999900",
-                "player_bullet": "#006699",
-                "enemy_bullet": "#990099",
-            }
-
-        bg_style = Style(bgcolor=colors["bg"])
-        self._styles = {
-            "bg": bg_style,
-            "player": Style(color=colors["player"], bgcolor=colors["bg"], bold=True),
-            "enemy0": Style(color=colors["enemy0"], bgcolor=colors["bg"], bold=True),
-            "enemy1": Style(color=colors["enemy1"], bgcolor=colors["bg"], bold=True),
-            "enemy2": Style(color=colors["enemy2"], bgcolor=colors["bg"], bold=True),
-            "player_bullet": Style(color=colors["player_bullet"], bgcolor=colors["bg"], bold=True),
-            "enemy_bullet": Style(color=colors["enemy_bullet"], bgcolor=colors["bg"], bold=True),
-        }
+        self._styles = _theme_styles(current_theme)
 
     def render_line(self, y: int) -> Strip:
         self._refresh_styles()
         styles = self._styles
-        bg_style = styles["bg"]
+        width = self._config.width
 
-        line_buffer = [" "] * self._config.width
-        style_buffer = [bg_style] * self._config.width
+        # Characters per column, plus a StyleSlot per column so runs are
+        # found by comparing small ints rather than Style objects
+        line_buffer = [" "] * width
+        style_buffer = bytearray(width)
 
         # Render enemies
-        for enemy in self._enemies:
-            if not enemy.active:
-                continue
-            if enemy.y <= y < enemy.y + self._config.enemy_height:
-                sprite_row = y - enemy.y
-                sprite = ENEMY_SPRITES.get(enemy.enemy_type, ENEMY_SPRITES[0])
-                if sprite_row < len(sprite):
-                    enemy_style = styles[f"enemy{enemy.enemy_type}"]
-                    for i, char in enumerate(sprite[sprite_row]):
-                        pos = enemy.x + i
-                        if 0 <= pos < self._config.width:
-                            line_buffer[pos] = char
-                            style_buffer[pos] = enemy_style
+        if y < len(self._enemy_rows):
+            for x, text, slot in self._enemy_rows[y]:
+                _stamp(line_buffer, style_buffer, x, text, slot)
 
         # Render player
         if self._config.player_y <= y < self._config.player_y + len(PLAYER_SPRITE):
             sprite_row = y - self._config.player_y
             if sprite_row < len(PLAYER_SPRITE):
-                player_style = styles["player"]
-                for i, char in enumerate(PLAYER_SPRITE[sprite_row]):
-                    pos = self._player.x + i
-                    if 0 <= pos < self._config.width:
-                        line_buffer[pos] = char
-                        style_buffer[pos] = player_style
+                _stamp(
+                    line_buffer,
+                    style_buffer,
+                    self._player.x,
+                    PLAYER_SPRITE[sprite_row],
+                    StyleSlot.PLAYER,
+                )
 
         # Render bullets
-        bullet_style = styles["player_bullet"]
-        for bullet in self._player_bullets:
-            if bullet.active and bullet.y == y:
-                if 0 <= bullet.x < self._config.width:
-                    line_buffer[bullet.x] = PLAYER_BULLET
-                    style_buffer[bullet.x] = bullet_style
-
-        enemy_bullet_style = styles["enemy_bullet"]
-        for bullet in self._enemy_bullets:
-            if bullet.active and bullet.y == y:
-                if 0 <= bullet.x < self._config.width:
-                    line_buffer[bullet.x] = ENEMY_BULLET
-                    style_buffer[bullet.x] = enemy_bullet_style
+        if y < len(self._bullet_rows):
+            for x, char, slot in self._bullet_rows[y]:
+                line_buffer[x] = char
+                style_buffer[x] = slot
 
         # Compress to segments
         segments = []
-        current_text = ""
-        current_style = style_buffer[0] if style_buffer else bg_style
-
-        for i in range(self._config.width):
-            if style_buffer[i] == current_style:
-                current_text += line_buffer[i]
-            else:
-                if current_text:
-                    segments.append(Segment(current_text, current_style))
-                current_text = line_buffer[i]
-                current_style = style_buffer[i]
-
-        if current_text:
-            segments.append(Segment(current_text, current_style))
+        if not width:
+            return Strip(segments)
+        run_start = 0
+        run_slot = style_buffer[0]
+        for i in range(1, width):
+            slot = style_buffer[i]
+            if slot != run_slot:
+                segments.append(
+                    Segment("".join(line_buffer[run_start:i]), styles[run_slot])
+                )
+                run_start = i
+                run_slot = slot
+        segments.append(Segment("".join(line_buffer[run_start:]), styles[run_slot]))
 
         return Strip(segments)
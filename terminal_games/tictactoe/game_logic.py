@@ -13,6 +13,20 @@ WIN_COMBOS = (
     (0, 4, 8),  
     (6, 4, 2),  
 )
+# The 8 rotations/reflections of the grid as index permutations
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),
+)
+CELL_CODES = {Player.X: 1, Player.O: 2}
+# Minimax scores keyed by symmetry-reduced board and player to move
+_score_cache: dict[tuple[bytes, Player], int] = {}
 def create_empty_board() -> Board:
     return tuple(range(9))
 def create_initial_state() -> GameState:
@@ -35,6 +49,16 @@ def check_tie(board: Board) -> bool:
     return len(get_empty_squares(board)) == 0
 def set_cell(board: Board, index: int, value: CellValue) -> Board:
     return tuple(value if i == index else cell for i, cell in enumerate(board))
+def canonical_key(board: Board) -> bytes:
+    codes = [CELL_CODES.get(cell, 0) for cell in board]
+    return min(bytes(codes[i] for i in perm) for perm in SYMMETRIES)
+def minimax_score(board: Board, player: Player) -> int:
+    key = (canonical_key(board), player)
+    score = _score_cache.get(key)
+    if score is None:
+        score = minimax(board, player)["score"]
+        _score_cache[key] = score
+    return score
 def minimax(board: Board, player: Player) -> dict:
     available_spots = get_empty_squares(board)
     if check_win(board, HUMAN_PLAYER) is not None:
@@ -48,10 +72,9 @@ def minimax(board: Board, player: Player) -> dict:
         move = {"index": spot, "score": 0}
         new_board = set_cell(board, spot, player)
         if player == AI_PLAYER:
-            result = minimax(new_board, HUMAN_PLAYER)
+            move["score"] = minimax_score(new_board, HUMAN_PLAYER)
         else:
-            result = minimax(new_board, AI_PLAYER)
-        move["score"] = result["score"]
+            move["score"] = minimax_score(new_board, AI_PLAYER)
         moves.append(move)
     if player == AI_PLAYER:
         best_score = -10000